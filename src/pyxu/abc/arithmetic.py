@@ -978,7 +978,7 @@ class ChainRule(Rule):
 
         * LINEAR
             op.adjoint(arr) = _rhs.adjoint(_lhs.adjoint(arr))
-            op.asarray() = _lhs.asarray() @ _rhs.asarray()
+            op.asarray() = _lhs.asarray() @ _rhs.asarray()  [diagonal factors applied by broadcasting]
             op.gram() = _rhs.T @ _lhs.gram() @ _rhs
             op.cogram() = _lhs @ _rhs.cogram() @ _lhs.T
 
@@ -1241,11 +1241,22 @@ class ChainRule(Rule):
         return out
 
     def asarray(self, **kwargs) -> pxt.NDArray:
-        A_lhs = self._lhs.asarray(**kwargs)
-        A_rhs = self._rhs.asarray(**kwargs)
+        # Diagonal factors are applied by broadcasting: no need to materialize diag(v) and pay for a dense contraction.
+        if (D := ChainRule._diagonal(self._lhs)) is not None:
+            A = self._rhs.asarray(**kwargs)
+            xp = pxu.get_array_module(A)
+            D = xp.asarray(D.astype(A.dtype, copy=False)).reshape(*self._lhs.dim_shape, *((1,) * self._rhs.dim_rank))
+            A = A * D
+        elif (D := ChainRule._diagonal(self._rhs)) is not None:
+            A = self._lhs.asarray(**kwargs)
+            xp = pxu.get_array_module(A)
+            A = A * xp.asarray(D.astype(A.dtype, copy=False))
+        else:
+            A_lhs = self._lhs.asarray(**kwargs)
+            A_rhs = self._rhs.asarray(**kwargs)
 
-        xp = pxu.get_array_module(A_lhs)
-        A = xp.tensordot(A_lhs, A_rhs, axes=self._lhs.dim_rank)
+            xp = pxu.get_array_module(A_lhs)
+            A = xp.tensordot(A_lhs, A_rhs, axes=self._lhs.dim_rank)
         return A
 
     def gram(self) -> pxt.OpT:
@@ -1256,6 +1267,17 @@ class ChainRule(Rule):
         op = self._lhs * self._rhs.cogram() * self._lhs.T
         return op.asop(pxo.SelfAdjointOp)
 
+    @staticmethod
+    def _diagonal(op: pxt.OpT) -> np.ndarray:
+        # Diagonal of element-wise scaling operators, broadcasted to `op.dim_shape`. (None otherwise.)
+        if op._name == "HomothetyOp":
+            D = np.full(op.dim_shape, op._cst)
+        elif op._name == "DiagonalOp":
+            D = np.broadcast_to(pxu.to_NUMPY(op._vec), op.dim_shape)
+        else:
+            D = None
+        return D
+
 
 class TransposeRule(Rule):
     # Not strictly-speaking an arithmetic method, but the logic behind constructing transposed
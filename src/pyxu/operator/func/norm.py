@@ -1,9 +1,13 @@
+import functools
+import math
+import string
+
 import numpy as np
-import scipy.optimize as sopt
 
 import pyxu.abc as pxa
 import pyxu.info.deps as pxd
 import pyxu.info.ptype as pxt
+import pyxu.runtime as pxrt
 import pyxu.util as pxu
 
 __all__ = [
@@ -27,7 +31,7 @@ class L1Norm(pxa.ProxFunc):
             dim_shape=dim_shape,
             codim_shape=1,
         )
-        self.lipschitz = np.sqrt(self.dim_size)
+        self.lipschitz = math.sqrt(self.dim_size)
 
     def apply(self, arr: pxt.NDArray) -> pxt.NDArray:
         xp = pxu.get_array_module(arr)
@@ -36,9 +40,13 @@ class L1Norm(pxa.ProxFunc):
         return y
 
     def prox(self, arr: pxt.NDArray, tau: pxt.Real) -> pxt.NDArray:
-        xp = pxu.get_array_module(arr)
-        y = xp.fmax(0, xp.fabs(arr) - tau)
-        y *= xp.sign(arr)
+        ndi = pxd.NDArrayInfo.from_obj(arr)
+        if (ndi == pxd.NDArrayInfo.NUMPY) and (arr.dtype in {_.value for _ in pxrt.Width}):
+            soft = _soft_threshold_cpu()
+            y = soft(arr, arr.dtype.type(tau))
+        else:
+            # soft-thresholding: soft_tau(x) = x - clip(x, -tau, tau)
+            y = arr - arr.clip(-tau, tau)
         return y
 
 
@@ -56,18 +64,26 @@ class L2Norm(pxa.ProxFunc):
         self.diff_lipschitz = np.inf
 
     def apply(self, arr: pxt.NDArray) -> pxt.NDArray:
+        # Contract core dimensions directly: avoids materializing `arr**2`.
         xp = pxu.get_array_module(arr)
-        axis = tuple(range(-self.dim_rank, 0))
-        y = xp.sqrt((arr**2).sum(axis=axis))[..., np.newaxis]
+        idx = string.ascii_letters[: self.dim_rank]
+        y = xp.sqrt(xp.einsum(f"...{idx},...{idx}->...", arr, arr))[..., np.newaxis]
         return y
 
     def prox(self, arr: pxt.NDArray, tau: pxt.Real) -> pxt.NDArray:
-        xp = pxu.get_array_module(arr)
-        scale = 1 - tau / xp.fmax(self.apply(arr), tau)  # (..., 1)
+        ndi = pxd.NDArrayInfo.from_obj(arr)
+        tau = arr.dtype.type(tau)  # keep `scale` in arr's precision: no up-cast/down-cast round-trip.
+        if (ndi == pxd.NDArrayInfo.NUMPY) and (arr.dtype in {_.value for _ in pxrt.Width}):
+            x = arr.reshape(-1, self.dim_size)
+            y = np.empty_like(x)
+            _l2_prox_cpu()(x, tau, y)
+            y = y.reshape(arr.shape)
+        else:
+            xp = ndi.module()
+            scale = 1 - tau / xp.fmax(self.apply(arr), tau)  # (..., 1)
 
-        y = arr.copy()
-        expand = (np.newaxis,) * (self.dim_rank - 1)
-        y *= scale[..., *expand]
+            expand = (np.newaxis,) * (self.dim_rank - 1)
+            y = arr * scale[..., *expand]
         return y
 
 
@@ -85,16 +101,17 @@ class SquaredL2Norm(pxa.QuadraticFunc):
         self.diff_lipschitz = 2
 
     def apply(self, arr: pxt.NDArray) -> pxt.NDArray:
-        axis = tuple(range(-self.dim_rank, 0))
-        y = (arr**2).sum(axis=axis)[..., np.newaxis]
+        # Contract core dimensions directly: avoids materializing `arr**2`.
+        xp = pxu.get_array_module(arr)
+        idx = string.ascii_letters[: self.dim_rank]
+        y = xp.einsum(f"...{idx},...{idx}->...", arr, arr)[..., np.newaxis]
         return y
 
     def grad(self, arr: pxt.NDArray) -> pxt.NDArray:
         return 2 * arr
 
     def prox(self, arr: pxt.NDArray, tau: pxt.Real) -> pxt.NDArray:
-        y = arr.copy()
-        y /= 2 * tau + 1
+        y = arr / arr.dtype.type(2 * tau + 1)
         return y
 
     def _quad_spec(self):
@@ -143,6 +160,8 @@ class SquaredL1Norm(pxa.ProxFunc):
 
         norm = self.apply(arr).item()
         if norm > 0:
+            import scipy.optimize as sopt
+
             xp = ndi.module()
 
             # Part 1: Compute \mu_opt -----------------------------------------
@@ -206,6 +225,8 @@ class LInfinityNorm(pxa.ProxFunc):
 
         mu_max = self.apply(arr).item()
         if mu_max > tau:
+            import scipy.optimize as sopt
+
             xp = ndi.module()
             mu_opt = sopt.brentq(
                 f=lambda mu: (xp.fabs(arr) - mu).clip(0, None).sum() - tau,
@@ -313,3 +334,42 @@ class PositiveL1Norm(pxa.ProxFunc):
     def prox(self, arr: pxt.NDArray, tau: pxt.Real) -> pxt.NDArray:
         y = (arr - tau).clip(0, None)
         return y
+
+
+# Helper Functions ------------------------------------------------------------
+@functools.cache
+def _soft_threshold_cpu():
+    # Single-pass soft-thresholding ufunc for NumPy inputs: one read + one write per element.
+    # Compiled lazily to avoid paying Numba's JIT cost at import time.
+    import numba
+
+    @numba.vectorize(
+        ["float32(float32, float32)", "float64(float64, float64)"],
+        nopython=True,
+        cache=True,
+    )
+    def soft(x, tau):
+        return math.copysign(max(abs(x) - tau, 0), x)
+
+    return soft
+
+
+@functools.cache
+def _l2_prox_cpu():
+    # Fused L2Norm.prox() kernel for NumPy inputs: each row's norm and rescaling are computed back-to-back, i.e. the
+    # input is streamed once per row without intermediate (..., M1,...,MD) buffers.
+    # Compiled lazily to avoid paying Numba's JIT cost at import time.
+    import numba
+
+    @numba.njit(parallel=True, fastmath={"reassoc"}, cache=True)
+    def prox(x, tau, out):
+        # x, out: (N, dim_size)
+        for i in numba.prange(x.shape[0]):
+            s = 0.0
+            for j in range(x.shape[1]):
+                s += x[i, j] * x[i, j]
+            scale = 1 - tau / max(math.sqrt(s), tau)
+            for j in range(x.shape[1]):
+                out[i, j] = x[i, j] * scale
+
+    return prox
@@ -50,8 +50,9 @@ class IdentityOp(pxa.OrthProjOp):
         return B
 
     def pinv(self, arr: pxt.NDArray, damp: pxt.Real, **kwargs) -> pxt.NDArray:
-        out = arr.copy()
-        out /= 1 + damp
+        xp = pxu.get_array_module(arr)
+        out = xp.empty_like(arr)
+        xp.divide(arr, 1 + damp, out=out)
         return out
 
     def dagger(self, damp: pxt.Real, **kwargs) -> pxt.OpT:
@@ -192,8 +193,9 @@ def HomothetyOp(dim_shape: pxt.NDArrayShape, cst: pxt.Real) -> pxt.OpT:
     else:  # build PosDef or SelfAdjointOp
 
         def op_apply(_, arr: pxt.NDArray) -> pxt.NDArray:
-            out = arr.copy()
-            out *= _._cst
+            xp = pxu.get_array_module(arr)
+            out = xp.empty_like(arr)
+            xp.multiply(arr, _._cst, out=out)
             return out
 
         def op_svdvals(_, **kwargs) -> pxt.NDArray:
@@ -209,8 +211,9 @@ def HomothetyOp(dim_shape: pxt.NDArrayShape, cst: pxt.Real) -> pxt.OpT:
             return D
 
         def op_pinv(_, arr: pxt.NDArray, damp: pxt.Real, **kwargs) -> pxt.NDArray:
-            out = arr.copy()
-            out *= _._cst / (_._cst**2 + damp)
+            xp = pxu.get_array_module(arr)
+            out = xp.empty_like(arr)
+            xp.multiply(arr, _._cst / (_._cst**2 + damp), out=out)
             return out
 
         def op_dagger(_, damp: pxt.Real, **kwargs) -> pxt.OpT:
@@ -299,18 +302,19 @@ def DiagonalOp(
         if (_._vec.dtype != arr.dtype) and _._enable_warnings:
             msg = "Computation may not be performed at the requested precision."
             warnings.warn(msg, pxw.PrecisionWarning)
-        out = arr.copy()
-        out *= _._vec
+        xp = pxu.get_array_module(arr)
+        out = xp.empty_like(arr)
+        xp.multiply(arr, _._vec, out=out)
         return out
 
     def op_asarray(_, **kwargs) -> pxt.NDArray:
-        xp = pxu.get_array_module(_._vec)
-        vec = xp.broadcast_to(_._vec, _.dim_shape)
-        A = xp.diag(vec.reshape(-1)).reshape((*_.codim_shape, *_.dim_shape))
-
         xp = kwargs.get("xp", pxd.NDArrayInfo.default().module())
         dtype = kwargs.get("dtype", pxrt.Width.DOUBLE.value)
-        B = xp.array(pxu.to_NUMPY(A), dtype=dtype)
+
+        # Only the diagonal transits between array backends: the (dim_size, dim_size) matrix is built in-place.
+        vec = np.broadcast_to(pxu.to_NUMPY(_._vec), _.dim_shape).reshape(-1)
+        A = xp.diag(xp.array(vec, dtype=dtype))
+        B = A.reshape((*_.codim_shape, *_.dim_shape))
         return B
 
     def op_gram(_):
@@ -337,22 +341,28 @@ def DiagonalOp(
             D = vec[-k:]
         return D.astype(dtype)
 
-    def op_pinv(_, arr: pxt.NDArray, damp: pxt.Real, **kwargs) -> pxt.NDArray:
-        xp = pxu.get_array_module(arr)
+    def pinv_scale(vec: pxt.NDArray, damp: pxt.Real) -> pxt.NDArray:
+        # vec / (vec**2 + damp), with 0/0 := 0.
+        # Evaluated in-place in a single buffer: NaNs can only arise (and hence need masking) if damp = 0.
+        xp = pxu.get_array_module(vec)
+        scale = xp.square(vec, dtype=np.result_type(vec, damp))
+        scale += damp
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            scale = _._vec / (_._vec**2 + damp)
+            xp.divide(vec, scale, out=scale)
+        if np.isclose(damp, 0):
             scale[xp.isnan(scale)] = 0
-        out = arr.copy()
-        out *= scale
+        return scale
+
+    def op_pinv(_, arr: pxt.NDArray, damp: pxt.Real, **kwargs) -> pxt.NDArray:
+        xp = pxu.get_array_module(arr)
+        scale = pinv_scale(_._vec, damp)
+        out = xp.empty_like(arr)
+        xp.multiply(arr, scale, out=out)
         return out
 
     def op_dagger(_, damp: pxt.Real, **kwargs) -> pxt.OpT:
-        xp = pxu.get_array_module(_._vec)
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            scale = _._vec / (_._vec**2 + damp)
-            scale[xp.isnan(scale)] = 0
+        scale = pinv_scale(_._vec, damp)
         return DiagonalOp(
             vec=scale,
             dim_shape=_.dim_shape,
@@ -1,7 +1,11 @@
+import functools
+
 import numpy as np
 
 import pyxu.abc as pxa
+import pyxu.info.deps as pxd
 import pyxu.info.ptype as pxt
+import pyxu.runtime as pxrt
 import pyxu.util as pxu
 
 __all__ = [
@@ -72,10 +76,27 @@ class Sum(pxa.LinOp):
         self._axis = tuple(axis)
         self.lipschitz = self.estimate_lipschitz()
 
+        # Flat (C-order) offsets of kept/reduced entries: x.ravel()[k + r] spans all terms of output `k`.
+        strides = np.cumprod((1, *self.dim_shape[:0:-1]))[::-1]
+        self._kept = _offsets(self.dim_shape, strides, [i for i in range(self.dim_rank) if i not in axis])
+        self._red = _offsets(self.dim_shape, strides, sorted(axis))
+
     def apply(self, arr: pxt.NDArray) -> pxt.NDArray:
         sh = arr.shape[: -self.dim_rank]
-        axis = tuple(ax + len(sh) for ax in self._axis)
-        out = arr.sum(axis=axis, keepdims=True)
+        ndi = pxd.NDArrayInfo.from_obj(arr)
+        if (
+            (ndi == pxd.NDArrayInfo.NUMPY)
+            and (arr.dtype in {_.value for _ in pxrt.Width})
+            and (arr.size >= 2**16)
+            and (_num_threads() > 1)  # single-threaded NumPy reductions are hard to beat
+        ):
+            x = arr.reshape(-1, self.dim_size)
+            out = np.empty((len(x), self.codim_size), dtype=arr.dtype)
+            _sum_cpu()(x, self._kept, self._red, out)
+            out = out.reshape(*sh, *self.codim_shape)
+        else:
+            axis = tuple(ax + len(sh) for ax in self._axis)
+            out = arr.sum(axis=axis, keepdims=True)
         return out
 
     def adjoint(self, arr: pxt.NDArray) -> pxt.NDArray:
@@ -88,3 +109,49 @@ class Sum(pxa.LinOp):
         M = np.prod(self.dim_shape) / np.prod(self.codim_shape)
         L = np.sqrt(M)
         return L
+
+
+# Helper Functions ------------------------------------------------------------
+def _offsets(shape: pxt.NDArrayShape, strides: np.ndarray, axes: list[int]) -> np.ndarray:
+    # Flat offsets of all entries spanned by `axes`, in C-order.
+    off = np.zeros((), dtype=np.intp)
+    for ax in axes:
+        off = np.add.outer(off, np.arange(shape[ax]) * strides[ax])
+    return off.reshape(-1)
+
+
+def _num_threads() -> int:
+    import numba
+
+    return numba.get_num_threads()
+
+
+@functools.cache
+def _sum_cpu():
+    # Single-pass Sum.apply() kernel for NumPy inputs: each output is accumulated directly from its summands, in
+    # parallel over (stack, kept) entries.
+    # Compiled lazily to avoid paying Numba's JIT cost at import time.
+    import numba
+
+    @numba.njit(parallel=True, fastmath={"reassoc"}, cache=True)
+    def reduce(x, kept, red, out):
+        # x: (N, dim_size); out: (N, codim_size)
+        N, K, B = x.shape[0], len(kept), 512
+        if red[-1] - red[0] == len(red) - 1:  # summands contiguous: reduce row-wise
+            for ik in numba.prange(N * K):
+                i, k = ik // K, ik % K
+                s = 0.0
+                for r in red:
+                    s += x[i, kept[k] + r]
+                out[i, k] = s
+        else:  # stream blocks of outputs over summands: inner loop walks (mostly) contiguous memory
+            nB = (K + B - 1) // B
+            for ib in numba.prange(N * nB):
+                i, b = ib // nB, ib % nB
+                k0, k1 = b * B, min((b + 1) * B, K)
+                out[i, k0:k1] = 0
+                for r in red:
+                    for k in range(k0, k1):
+                        out[i, k] += x[i, kept[k] + r]
+
+    return reduce
@@ -2,6 +2,7 @@
 Low-level functions used to define user-facing stencils.
 """
 import collections.abc as cabc
+import functools
 import itertools
 import pathlib as plib
 import string
@@ -63,6 +64,19 @@ def _signature(params, returns) -> str:
     return sig
 
 
+@functools.lru_cache(maxsize=128)
+def _jit_module(klass, dtype: str, shape: tuple, coef: bytes, center: tuple) -> types.ModuleType:
+    # Compiled module of a `klass` stencil, as produced by `klass._gen_code()`.
+    #
+    # Coefficients are part of the key since they are hard-coded in the generated code.
+    # Memoizing the module (rather than relying on the on-disk cache alone) means re-instantiating a known stencil,
+    # as done at every Stencil.apply() call, skips code generation and file I/O.
+    st = klass.__new__(klass)
+    st._kernel = np.frombuffer(coef, dtype=dtype).reshape(shape)
+    st._center = np.array(center, dtype=int)
+    return st._gen_code()
+
+
 class _Stencil:
     """
     Multi-dimensional JIT-compiled stencil. (Low-level function.)
@@ -207,7 +221,14 @@ class _Stencil:
         self._kernel = kernel
         self._center = center
 
-        cached_module = self._gen_code()
+        coef = pxu.to_NUMPY(kernel)
+        cached_module = _jit_module(
+            klass=type(self),
+            dtype=coef.dtype.str,
+            shape=coef.shape,
+            coef=coef.tobytes(),
+            center=tuple(center.tolist()),
+        )
         self._dispatch = cached_module.f_jit
 
     def _gen_code(self) -> types.ModuleType:
@@ -1,5 +1,6 @@
 import collections.abc as cabc
 import datetime as dt
+import string
 import warnings
 
 import numpy as np
@@ -33,7 +34,9 @@ def _norm(x: pxt.NDArray, ord: pxt.Integer, rank: pxt.Integer) -> pxt.NDArray:
     elif ord == 1:
         n = xp.sum(xp.fabs(x), axis=axis)
     elif ord == 2:
-        n = xp.sqrt(xp.sum(x**2, axis=axis))
+        # Contract core dimensions directly: no (..., M1,...,MD) temporary is allocated.
+        idx = string.ascii_letters[:rank]
+        n = xp.sqrt(xp.einsum(f"...{idx},...{idx}->...", x, x))
     elif ord == np.inf:
         n = xp.max(xp.fabs(x), axis=axis)
     else: